@@ -6,11 +6,33 @@ Features: Super food that gives +5 length and +50 points
 """
 
 import curses
+import os
 import random
+import sys
 import time
-from collections import deque
+from array import array
 
 class SnakeGame:
+    # Smallest terminal the game can be played in
+    MIN_HEIGHT = 10
+    MIN_WIDTH = 30
+    
+    # Map keys to directions (y, x)
+    _KEY_DIRECTIONS = {
+        ord('w'): (-1, 0),  # Up
+        ord('W'): (-1, 0),
+        curses.KEY_UP: (-1, 0),
+        ord('s'): (1, 0),   # Down
+        ord('S'): (1, 0),
+        curses.KEY_DOWN: (1, 0),
+        ord('a'): (0, -1),  # Left
+        ord('A'): (0, -1),
+        curses.KEY_LEFT: (0, -1),
+        ord('d'): (0, 1),   # Right
+        ord('D'): (0, 1),
+        curses.KEY_RIGHT: (0, 1),
+    }
+    
     def __init__(self, stdscr):
         self.stdscr = stdscr
         self.setup_screen()
@@ -23,18 +45,36 @@ class SnakeGame:
         self.normal_speed = 100  # Normal speed (100ms)
         self.boost_speed = 50   # Boost speed (50ms = 2x faster)
         self.stdscr.timeout(self.normal_speed)  # Set initial refresh rate
-        
-        # Initialize colors
-        curses.start_color()
-        curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Snake
-        curses.init_pair(2, curses.COLOR_RED, curses.COLOR_BLACK)    # Food
-        curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK) # Score & Super food
-        curses.init_pair(4, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Border
-        curses.init_pair(5, curses.COLOR_MAGENTA, curses.COLOR_BLACK) # Super food alternative
+        self._current_timeout = self.normal_speed
         
         # Get screen dimensions
         self.height, self.width = self.stdscr.getmaxyx()
         
+        # curses only handles terminal setup and input. Let it clear the
+        # screen once, after that stdscr stays untouched so getch() never
+        # repaints over the frames written below
+        self.stdscr.refresh()
+        
+        # Frames are collected as raw VT escapes and written with one write()
+        self._out_fd = sys.stdout.fileno()
+        self._frame = bytearray(b'\x1b[?25l')  # Hide cursor, sent once with the first frame
+        
+        # SGR color attributes
+        self.attr_plain = b'\x1b[0m'
+        self.attr_snake_head = b'\x1b[0;1;32m'  # Green
+        self.attr_snake_body = b'\x1b[0;32m'
+        self.attr_food = b'\x1b[0;1;31m'        # Red
+        self.attr_super = b'\x1b[0;1;33m'       # Yellow
+        self.attr_border = b'\x1b[0;37m'        # White
+        self.attr_score = b'\x1b[0;33m'         # Yellow
+        
+        # Attribute and character for each kind of play field cell
+        self.cell_snake_head = self.attr_snake_head + b'O'
+        self.cell_snake_body = self.attr_snake_body + b'o'
+        self.cell_food = self.attr_food + 'ø'.encode()
+        self.cell_super = self.attr_super + 'π'.encode()
+        self.cell_empty = self.attr_plain + b' '
+        
     def setup_game(self):
         """Initialize game state"""
         # Game boundaries (leave space for border and score)
@@ -45,11 +85,31 @@ class SnakeGame:
         start_y = self.game_height // 2
         start_x = self.game_width // 2
         
-        # Snake represented as deque of (y, x) coordinates
-        self.snake = deque([(start_y, start_x), (start_y, start_x - 1), (start_y, start_x - 2)])
+        # Snake represented as a ring buffer of y and x coordinates,
+        # running from head_idx to tail_idx (big enough for the whole board)
+        self.snake_capacity = self.game_height * self.game_width
+        self.snake_y = array('h', [0]) * self.snake_capacity
+        self.snake_x = array('h', [0]) * self.snake_capacity
+        for i in range(3):
+            self.snake_y[i] = start_y
+            self.snake_x[i] = start_x - i
+        self.head_idx = 0
+        self.tail_idx = 2
+        self.snake_len = 3
+        # Set of occupied cells for O(1) collision checks. Cells (and food
+        # positions) are keyed as y * game_width + x
+        self.snake_cells = {start_y * self.game_width + start_x - i for i in range(3)}
+        
+        # Cells not covered by the snake, food is picked from these
+        self.free_cells = {y * self.game_width + x for y in range(1, self.game_height)
+                           for x in range(1, self.game_width)} - self.snake_cells
+        
+        # Moves left during which the tail stays put (snake grows)
+        self.pending_growth = 0
         
         # Initial direction (moving right)
-        self.direction = (0, 1)
+        self.dy = 0
+        self.dx = 1
         
         # Score
         self.score = 0
@@ -58,163 +118,236 @@ class SnakeGame:
         self.super_food = None
         self.super_food_timer = 0
         
+        # Instructions only depend on the screen width (truncate if too long)
+        self._instructions_line = "WASD/Arrows to move, Hold same key for speed boost, Q to quit"
+        max_instruction_length = self.game_width - 2
+        if len(self._instructions_line) > max_instruction_length:
+            self._instructions_line = self._instructions_line[:max_instruction_length-3] + "..."
+        
         # Generate first food
         self.generate_food()
         
+        # Paint the static parts of the screen
+        self.redraw_screen()
+        
+    def redraw_screen(self):
+        """Repaint the whole screen and forget the previous frame"""
+        self._frame += b'\x1b[2J'  # Clear screen
+        self.draw_border()
+        self.draw_instructions()
+        self.draw_snake()
+        
+        # Previous frame state (only changed cells get redrawn)
+        self.prev_food = None
+        self.prev_super_food = None
+        self._prev_drawn_score = -1
+        
     def generate_food(self):
         """Generate food at random location not occupied by snake"""
-        while True:
-            food_y = random.randint(1, self.game_height - 1)
-            food_x = random.randint(1, self.game_width - 1)
-            if (food_y, food_x) not in self.snake:
-                # Make sure super food doesn't overlap
-                if not self.super_food or (food_y, food_x) != self.super_food:
-                    self.food = (food_y, food_x)
-                    break
+        # Make sure super food doesn't overlap
+        candidates = self.free_cells - {self.super_food}
+        self.food = random.choice(tuple(candidates)) if candidates else None
                     
     def generate_super_food(self):
         """Generate super food occasionally"""
-        if random.randint(1, 8) == 1:  # 12.5% chance (1 in 8)
-            attempts = 0
-            while attempts < 10:  # Prevent infinite loop
-                food_y = random.randint(1, self.game_height - 1)
-                food_x = random.randint(1, self.game_width - 1)
-                if ((food_y, food_x) not in self.snake and 
-                    (food_y, food_x) != self.food):
-                    self.super_food = (food_y, food_x)
-                    self.super_food_timer = 150  # Disappears after 150 moves
-                    break
-                attempts += 1
+        if random.randrange(8) == 0:  # 12.5% chance (1 in 8)
+            candidates = self.free_cells - {self.food}
+            if candidates:
+                self.super_food = random.choice(tuple(candidates))
+                self.super_food_timer = 150  # Disappears after 150 moves
                 
     def draw_border(self):
         """Draw game border"""
-        try:
-            # Top and bottom borders
-            for x in range(self.width - 1):
-                self.stdscr.addch(0, x, '-', curses.color_pair(4))
-                if self.game_height + 1 < self.height - 1:
-                    self.stdscr.addch(self.game_height + 1, x, '-', curses.color_pair(4))
+        # Top and bottom borders (laid out from the board, which can be
+        # smaller than the screen after a resize)
+        line = b'-' * (self.game_width + 1)
+        self.draw_text(0, 0, line, self.attr_border)
+        self.draw_text(self.game_height + 1, 0, line, self.attr_border)
             
-            # Left and right borders
-            for y in range(self.height - 1):
-                self.stdscr.addch(y, 0, '|', curses.color_pair(4))
-                if self.width > 1:
-                    self.stdscr.addch(y, self.width - 2, '|', curses.color_pair(4))
-        except curses.error:
-            pass  # Ignore cursor position errors at screen edges
+        # Left and right borders
+        for y in range(self.game_height + 2):
+            self.draw_text(y, 0, b'|', self.attr_border)
+            self.draw_text(y, self.game_width, b'|', self.attr_border)
                 
     def draw_score(self):
-        """Draw score and instructions"""
-        score_text = f"Score: {self.score}"
-        instructions = "WASD/Arrows to move, Hold same key for speed boost, Q to quit"
+        """Draw score if it changed since the last frame"""
+        if self.score == self._prev_drawn_score:
+            return
+        self._prev_drawn_score = self.score
         
-        # Draw score at bottom
-        if self.height > 2:
-            self.stdscr.addstr(self.height - 2, 2, score_text, curses.color_pair(3))
+        # Draw score below the board
+        self.draw_text(self.game_height + 2, 2, b'Score: %d' % self.score, self.attr_score)
             
-        # Draw instructions (truncate if too long for screen)
-        if self.height > 1:
-            max_instruction_length = self.width - 4
-            if len(instructions) > max_instruction_length:
-                instructions = instructions[:max_instruction_length-3] + "..."
-            self.stdscr.addstr(self.height - 1, 2, instructions)
+    def draw_instructions(self):
+        """Draw instructions (they never change mid-game)"""
+        self.draw_text(self.game_height + 3, 2, self._instructions_line.encode())
+        
+    def draw_text(self, y, x, text, attr=None):
+        """Queue already encoded text at a screen position"""
+        self._frame += b'\x1b[%d;%dH%b%b' % (y + 1, x + 1, attr or self.attr_plain, text)
             
-    def draw_snake(self):
-        """Draw the snake"""
-        for i, (y, x) in enumerate(self.snake):
-            if 0 < y < self.game_height and 0 < x < self.game_width:
-                try:
-                    if i == 0:  # Snake head
-                        self.stdscr.addch(y, x, 'O', curses.color_pair(1) | curses.A_BOLD)
-                    else:  # Snake body
-                        self.stdscr.addch(y, x, 'o', curses.color_pair(1))
-                except curses.error:
-                    pass
-                    
-    def draw_food(self):
-        """Draw the regular food"""
-        y, x = self.food
+    def draw_cell(self, y, x, cell):
+        """Queue a single cell (attribute + character) inside the play field"""
         if 0 < y < self.game_height and 0 < x < self.game_width:
-            try:
-                # Changed from '*' to '@' for better visibility
-                self.stdscr.addch(y, x, 'ø', curses.color_pair(2) | curses.A_BOLD)
-            except curses.error:
-                pass
+            self._frame += b'\x1b[%d;%dH%b' % (y + 1, x + 1, cell)
                 
+    def draw_snake(self):
+        """Draw the whole snake (moves are drawn by move_snake)"""
+        i = self.head_idx
+        for n in range(self.snake_len):
+            if n == 0:  # Snake head
+                self.draw_cell(self.snake_y[i], self.snake_x[i], self.cell_snake_head)
+            else:  # Snake body
+                self.draw_cell(self.snake_y[i], self.snake_x[i], self.cell_snake_body)
+            i = (i + 1) % self.snake_capacity
+        
+    def draw_food(self):
+        """Draw the regular food if it moved"""
+        if self.food == self.prev_food:
+            return
+        if self.prev_food is not None and self.prev_food not in self.snake_cells:
+            self.draw_cell(*divmod(self.prev_food, self.game_width), self.cell_empty)
+        if self.food is not None:
+            # Changed from '*' to '@' for better visibility
+            self.draw_cell(*divmod(self.food, self.game_width), self.cell_food)
+        self.prev_food = self.food
+        
     def draw_super_food(self):
-        """Draw the super food"""
-        if self.super_food:
-            y, x = self.super_food
-            if 0 < y < self.game_height and 0 < x < self.game_width:
-                try:
-                    # Super food is a yellow '%' symbol
-                    self.stdscr.addch(y, x, 'π', curses.color_pair(3) | curses.A_BOLD)
-                except curses.error:
-                    pass
+        """Draw the super food, or erase it once it expired"""
+        if self.super_food == self.prev_super_food:
+            return
+        if self.prev_super_food is not None and self.prev_super_food not in self.snake_cells:
+            self.draw_cell(*divmod(self.prev_super_food, self.game_width), self.cell_empty)
+        if self.super_food is not None:
+            # Super food is a yellow '%' symbol
+            self.draw_cell(*divmod(self.super_food, self.game_width), self.cell_super)
+        self.prev_super_food = self.super_food
+        
+    def flush_frame(self):
+        """Write the queued frame to the terminal in a single write()"""
+        # Synchronized update (DECSET 2026): supporting terminals show the
+        # frame all at once, others ignore the sequences
+        self._frame[:0] = b'\x1b[?2026h'
+        self._frame += b'\x1b[?2026l'
+        written = 0
+        while written < len(self._frame):
+            written += os.write(self._out_fd, self._frame[written:])
+        self._frame.clear()
+            
+    def board_fits(self):
+        """Check the board, its border and the score rows fit on screen"""
+        return (self.height >= self.game_height + 4 and
+                self.width >= self.game_width + 2)
+                
+    def wait_for_usable_size(self):
+        """Re-read the screen size, pausing while it is too small (False if the player quit)"""
+        self.height, self.width = self.stdscr.getmaxyx()
+        if self.height >= self.MIN_HEIGHT and self.width >= self.MIN_WIDTH:
+            return True
+            
+        # Block in getch() until the terminal is big enough again
+        previous_timeout = self._current_timeout
+        self._set_timeout(-1)
+        try:
+            while self.height < self.MIN_HEIGHT or self.width < self.MIN_WIDTH:
+                self._frame += b'\x1b[2J'  # Clear screen
+                message = b"Terminal too small! Please resize to at least %dx%d characters." % (
+                    self.MIN_WIDTH, self.MIN_HEIGHT)
+                self.draw_text(0, 0, message[:max(self.width - 1, 0)])
+                self.flush_resize_frame()
+                
+                key = self.stdscr.getch()
+                if key == ord('q') or key == ord('Q'):
+                    return False
+                if key == curses.KEY_RESIZE:
+                    self.height, self.width = self.stdscr.getmaxyx()
+            return True
+        finally:
+            self._set_timeout(previous_timeout)
+            
+    def flush_resize_frame(self):
+        """Write a repaint queued after KEY_RESIZE"""
+        # ncurses marks stdscr as changed on KEY_RESIZE, and unless it is
+        # refreshed here the next getch() refreshes it and wipes our frame.
+        # That refresh writes its own clear, so do it right before our
+        # frame to keep the two writes back to back
+        self.stdscr.refresh()
+        self.flush_frame()
+        
+    def _set_timeout(self, t):
+        """Change the getch() timeout, skipping the call if it is unchanged"""
+        if t != self._current_timeout:
+            self.stdscr.timeout(t)
+            self._current_timeout = t
             
     def handle_input(self):
         """Handle keyboard input and manage speed boost"""
         key = self.stdscr.getch()
         
-        # Map keys to directions (y, x)
-        key_directions = {
-            ord('w'): (-1, 0),  # Up
-            ord('W'): (-1, 0),
-            curses.KEY_UP: (-1, 0),
-            ord('s'): (1, 0),   # Down
-            ord('S'): (1, 0),
-            curses.KEY_DOWN: (1, 0),
-            ord('a'): (0, -1),  # Left
-            ord('A'): (0, -1),
-            curses.KEY_LEFT: (0, -1),
-            ord('d'): (0, 1),   # Right
-            ord('D'): (0, 1),
-            curses.KEY_RIGHT: (0, 1),
-        }
-        
-        # Check if a direction key was pressed
-        if key in key_directions:
-            new_direction = key_directions[key]
+        # Terminal was resized. Keep playing if the board still fits,
+        # otherwise run() ends the game
+        if key == curses.KEY_RESIZE:
+            if not self.wait_for_usable_size():
+                return False
+            if self.board_fits():
+                self.redraw_screen()
+            self.flush_resize_frame()
             
+        # Check if a direction key was pressed
+        new_direction = SnakeGame._KEY_DIRECTIONS.get(key)
+        if new_direction:
+            dy, dx = new_direction
             # Check if pressing same direction as current movement (speed boost)
-            if new_direction == self.direction:
+            if dy == self.dy and dx == self.dx:
                 # Activate speed boost
-                self.stdscr.timeout(self.boost_speed)
+                self._set_timeout(self.boost_speed)
             else:
                 # Reset to normal speed
-                self.stdscr.timeout(self.normal_speed)
+                self._set_timeout(self.normal_speed)
                 # Prevent snake from going backwards into itself
-                if new_direction != (-self.direction[0], -self.direction[1]):
-                    self.direction = new_direction
+                if dy != -self.dy or dx != -self.dx:
+                    self.dy = dy
+                    self.dx = dx
         else:
             # No direction key pressed, reset to normal speed
-            self.stdscr.timeout(self.normal_speed)
+            self._set_timeout(self.normal_speed)
                 
         return key != ord('q') and key != ord('Q')
         
     def move_snake(self):
         """Move snake and check for collisions"""
-        head_y, head_x = self.snake[0]
-        new_head = (head_y + self.direction[0], head_x + self.direction[1])
+        head_y = self.snake_y[self.head_idx]
+        head_x = self.snake_x[self.head_idx]
+        new_y = head_y + self.dy
+        new_x = head_x + self.dx
         
         # Check wall collision
-        if (new_head[0] <= 0 or new_head[0] >= self.game_height or
-            new_head[1] <= 0 or new_head[1] >= self.game_width):
+        if (new_y <= 0 or new_y >= self.game_height or
+            new_x <= 0 or new_x >= self.game_width):
             return False
             
         # Check self collision
-        if new_head in self.snake:
+        new_head = new_y * self.game_width + new_x
+        if new_head in self.snake_cells:
             return False
             
         # Add new head
-        self.snake.appendleft(new_head)
+        self.head_idx = (self.head_idx - 1) % self.snake_capacity
+        self.snake_y[self.head_idx] = new_y
+        self.snake_x[self.head_idx] = new_x
+        self.snake_len += 1
+        self.snake_cells.add(new_head)
+        self.free_cells.discard(new_head)
+        
+        # Demote the old head to a body segment and draw the new head
+        self.draw_cell(head_y, head_x, self.cell_snake_body)
+        self.draw_cell(new_y, new_x, self.cell_snake_head)
         
         # Check if super food eaten
-        if self.super_food and new_head == self.super_food:
+        if new_head == self.super_food:
             self.score += 50  # 50 points for super food
             # Grow snake by 5 segments (don't remove tail for next 4 moves)
-            for _ in range(4):  # Already added 1 head, add 4 more body segments
-                self.snake.append(self.snake[-1])
+            self.pending_growth += 4  # Already added 1 head, 4 more to go
             self.super_food = None
             self.super_food_timer = 0
             self.generate_super_food()  # Chance for new super food
@@ -225,72 +358,95 @@ class SnakeGame:
             self.score += 10  # 10 points for regular food
             self.generate_food()
             self.generate_super_food()  # Chance for super food when eating regular food
+        elif self.pending_growth > 0:
+            # Still growing from super food, keep the tail
+            self.pending_growth -= 1
         else:
             # Remove tail (snake doesn't grow)
-            self.snake.pop()
+            tail_y = self.snake_y[self.tail_idx]
+            tail_x = self.snake_x[self.tail_idx]
+            self.tail_idx = (self.tail_idx - 1) % self.snake_capacity
+            self.snake_len -= 1
+            tail = tail_y * self.game_width + tail_x
+            self.snake_cells.discard(tail)
+            self.free_cells.add(tail)
+            self.draw_cell(tail_y, tail_x, self.cell_empty)
             
         # Handle super food timer
-        if self.super_food:
+        if self.super_food is not None:
             self.super_food_timer -= 1
             if self.super_food_timer <= 0:
                 self.super_food = None
             
         return True
         
-    def game_over_screen(self):
-        """Display game over screen"""
-        self.stdscr.clear()
+    def draw_game_over(self):
+        """Queue the game over message"""
+        self._frame += b'\x1b[2J'  # Clear screen
         
         # Center the game over message
-        game_over_msg = "GAME OVER!"
-        final_score_msg = f"Final Score: {self.score}"
-        snake_length_msg = f"Snake Length: {len(self.snake)}"
-        restart_msg = "Press R to restart or Q to quit"
+        game_over_msg = b"GAME OVER!"
+        final_score_msg = b"Final Score: %d" % self.score
+        snake_length_msg = b"Snake Length: %d" % self.snake_len
+        restart_msg = b"Press R to restart or Q to quit"
         
         center_y = self.height // 2
         center_x = self.width // 2
         
-        self.stdscr.addstr(center_y - 2, center_x - len(game_over_msg) // 2, 
-                          game_over_msg, curses.color_pair(2) | curses.A_BOLD)
-        self.stdscr.addstr(center_y - 1, center_x - len(final_score_msg) // 2, 
-                          final_score_msg, curses.color_pair(3))
-        self.stdscr.addstr(center_y, center_x - len(snake_length_msg) // 2, 
-                          snake_length_msg, curses.color_pair(3))
-        self.stdscr.addstr(center_y + 2, center_x - len(restart_msg) // 2, 
-                          restart_msg)
+        self.draw_text(center_y - 2, center_x - len(game_over_msg) // 2, 
+                       game_over_msg, self.attr_food)
+        self.draw_text(center_y - 1, center_x - len(final_score_msg) // 2, 
+                       final_score_msg, self.attr_score)
+        self.draw_text(center_y, center_x - len(snake_length_msg) // 2, 
+                       snake_length_msg, self.attr_score)
+        self.draw_text(center_y + 2, center_x - len(restart_msg) // 2, 
+                       restart_msg)
         
-        self.stdscr.refresh()
+    def game_over_screen(self):
+        """Display game over screen"""
+        self.draw_game_over()
+        self.flush_frame()
         
-        # Wait for user input
-        while True:
-            key = self.stdscr.getch()
-            if key == ord('q') or key == ord('Q'):
-                return False
-            elif key == ord('r') or key == ord('R'):
-                return True
+        # Wait for user input, blocking in getch() instead of polling
+        self.stdscr.nodelay(0)
+        self._set_timeout(-1)
+        try:
+            while True:
+                key = self.stdscr.getch()
+                if key == curses.KEY_RESIZE:
+                    # Terminal was resized, re-center and repaint the message
+                    # (a restart picks up the new size in setup_game)
+                    if not self.wait_for_usable_size():
+                        return False
+                    self.draw_game_over()
+                    self.flush_resize_frame()
+                elif key == ord('q') or key == ord('Q'):
+                    return False
+                elif key == ord('r') or key == ord('R'):
+                    return True
+        finally:
+            # A restarted game always begins at normal speed
+            self.stdscr.nodelay(1)
+            self._set_timeout(self.normal_speed)
                 
     def run(self):
         """Main game loop"""
         while True:
-            # Clear screen
-            self.stdscr.clear()
-            
-            # Draw game elements
-            self.draw_border()
-            self.draw_snake()
+            # Draw only what changed since the last frame (move_snake draws the snake)
             self.draw_food()
             self.draw_super_food()  # Draw super food if it exists
             self.draw_score()
             
-            # Refresh screen
-            self.stdscr.refresh()
+            # Write the frame only if something was drawn
+            if self._frame:
+                self.flush_frame()
             
             # Handle input
             if not self.handle_input():
                 break
                 
-            # Move snake
-            if not self.move_snake():
+            # Move snake (a board that no longer fits the screen ends the game too)
+            if not self.board_fits() or not self.move_snake():
                 if self.game_over_screen():
                     # Restart game
                     self.setup_game()
@@ -314,7 +470,7 @@ if __name__ == "__main__":
         height, width = stdscr.getmaxyx()
         curses.endwin()
         
-        if height < 10 or width < 30:
+        if height < SnakeGame.MIN_HEIGHT or width < SnakeGame.MIN_WIDTH:
             print("Terminal too small! Please resize to at least 30x10 characters.")
             exit(1)
             